@@ -72,13 +72,14 @@ class IOQueue:
         self.map = {}  # maps id(stream) to [task_waiting_read, task_waiting_write, stream]
 
     def _enqueue(self, s, idx):
-        if id(s) not in self.map:
+        sid = id(s)
+        sm = self.map.get(sid)  # Single lookup for both new and existing entries
+        if sm is None:
             entry = [None, None, s]
             entry[idx] = cur_task
-            self.map[id(s)] = entry
+            self.map[sid] = entry
             self.poller.register(s, select.POLLIN if idx == 0 else select.POLLOUT)
         else:
-            sm = self.map[id(s)]
             assert sm[idx] is None
             assert sm[1 - idx] is not None
             sm[idx] = cur_task
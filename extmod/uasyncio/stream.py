@@ -74,12 +74,48 @@ StreamReader = Stream
 StreamWriter = Stream
 
 
+# Cache of getaddrinfo results used by open_connection, so that reconnecting to
+# the same host does not repeat a (blocking) DNS lookup every time.
+# Maps (host, port) to (ticks when looked up, addrinfo entry).
+_gai_cache = {}
+_GAI_CACHE_TTL_MS = 60000
+_GAI_CACHE_MAX = 8
+
+# Poller used to check the outcome of a non-blocking connect, created on first use
+_connect_poller = None
+
+
+def _getaddrinfo(host, port):
+    import usocket as socket
+
+    key = (host, port)
+    now = core.ticks()
+    entry = _gai_cache.get(key)
+    if entry is not None and 0 <= core.ticks_diff(now, entry[0]) < _GAI_CACHE_TTL_MS:
+        return entry[1]
+    ai = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)[0]  # TODO this is blocking!
+    # Evict expired entries when adding a new one, so that ticks_diff() is mostly applied
+    # to recent timestamps.  Note: an entry may still read as fresh again if neither it
+    # nor any new host is looked up for a whole ticks period (2**30 ms on most ports).
+    expired = [
+        k for k, v in _gai_cache.items() if not 0 <= core.ticks_diff(now, v[0]) < _GAI_CACHE_TTL_MS
+    ]
+    for k in expired:
+        del _gai_cache[k]
+    if len(_gai_cache) >= _GAI_CACHE_MAX:
+        _gai_cache.clear()
+    _gai_cache[key] = (now, ai)
+    return ai
+
+
 # Create a TCP stream connection to a remote host
 async def open_connection(host, port):
     from uerrno import EINPROGRESS
     import usocket as socket
+    import uselect as select
 
-    ai = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)[0]  # TODO this is blocking!
+    global _connect_poller
+    ai = _getaddrinfo(host, port)
     s = socket.socket(ai[0], ai[1], ai[2])
     s.setblocking(False)
     ss = Stream(s)
@@ -87,8 +123,21 @@ async def open_connection(host, port):
         s.connect(ai[-1])
     except OSError as er:
         if er.errno != EINPROGRESS:
+            # Address may be stale, so look it up again next time
+            _gai_cache.pop((host, port), None)
             raise er
     yield core._io_queue.queue_write(s)
+    # A failed non-blocking connect (eg refused or unreachable) leaves an error on the
+    # socket.  The stream is still returned and the error is raised by the first read or
+    # write, but drop the possibly stale cached address now.  POLLHUP together with
+    # POLLOUT is a connected socket whose peer went away, so that is not a failure.
+    if _connect_poller is None:
+        _connect_poller = select.poll()
+    _connect_poller.register(s, select.POLLOUT | select.POLLERR | select.POLLHUP)
+    for _, ev in _connect_poller.ipoll(0):
+        if ev & select.POLLERR or (ev & select.POLLHUP and not ev & select.POLLOUT):
+            _gai_cache.pop((host, port), None)
+    _connect_poller.unregister(s)
     return ss, ss
 
 
@@ -0,0 +1,57 @@
+# Test caching of address lookups by uasyncio.open_connection()
+# This relies on uasyncio internals so is MicroPython-only.
+
+try:
+    import uasyncio as asyncio
+    import uasyncio.stream as stream
+except ImportError:
+    print("SKIP")
+    raise SystemExit
+
+if not hasattr(stream, "_gai_cache"):
+    print("SKIP")
+    raise SystemExit
+
+PORT = 8000
+CLOSED_PORT = 8001
+
+
+async def handle_connection(reader, writer):
+    data = await reader.read(100)
+    writer.write(data)
+    await writer.drain()
+    writer.close()
+    await writer.wait_closed()
+
+
+async def test():
+    server = await asyncio.start_server(handle_connection, "0.0.0.0", PORT)
+    async with server:
+        key = ("127.0.0.1", PORT)
+        stamp = None
+        for i in range(3):
+            reader, writer = await asyncio.open_connection("127.0.0.1", PORT)
+            writer.write(b"hello %d" % i)
+            await writer.drain()
+            print("read:", await reader.read(100))
+            writer.close()
+            await writer.wait_closed()
+            # The address is looked up once and then reused from the cache
+            if stamp is None:
+                stamp = stream._gai_cache[key][0]
+            print("cached:", len(stream._gai_cache), stream._gai_cache[key][0] == stamp)
+
+    # A failed connect must drop the cached address
+    key = ("127.0.0.1", CLOSED_PORT)
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", CLOSED_PORT)
+        writer.close()
+        await writer.wait_closed()
+    except OSError:
+        pass
+    print("failed cached:", key in stream._gai_cache)
+    print("done")
+
+
+stream._gai_cache.clear()
+asyncio.run(test())